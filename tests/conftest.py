@@ -1,12 +1,13 @@
 """Shared test fixtures for USASpending API tests."""
 
 import copy
+import functools
 import json
-from pathlib import Path
 
 import pytest
 
 from tests.mocks import MockUSASpendingClient
+from tests.mocks.mock_client import FIXTURES_DIR
 from usaspending.config import config
 
 
@@ -88,9 +89,13 @@ def mock_usa_client():
 
 def load_json_fixture(relative_path):
     """Helper to load a JSON fixture file given a relative path from the test directory."""
-    fixture_path = Path(__file__).parent / "fixtures" / relative_path
-    with open(fixture_path) as f:
-        return json.load(f)
+    return json.loads((FIXTURES_DIR / relative_path).read_bytes())
+
+
+@functools.cache
+def _load_shared_json_fixture(relative_path):
+    """Load a JSON fixture once per process and return the shared, read-only result."""
+    return load_json_fixture(relative_path)
 
 
 @pytest.fixture
@@ -103,85 +108,90 @@ def load_fixture():
     return _load
 
 
-@pytest.fixture
+# The JSON fixtures below are parsed once per session and shared between tests.
+# Tests must treat the returned data as read-only; use load_json_fixture()
+# directly when a test needs a private copy it can modify.
+
+
+@pytest.fixture(scope="session")
 def award_fixture_data():
     """Load the award fixture data."""
-    return load_json_fixture("awards/contract.json")
+    return _load_shared_json_fixture("awards/contract.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def contract_fixture_data():
     """Load the award fixture data."""
-    return load_json_fixture("awards/contract.json")
+    return _load_shared_json_fixture("awards/contract.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def idv_fixture_data():
     """Load the award fixture data."""
-    return load_json_fixture("awards/idv.json")
+    return _load_shared_json_fixture("awards/idv.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grant_fixture_data():
     """Load the award fixture data."""
-    return load_json_fixture("awards/grant.json")
+    return _load_shared_json_fixture("awards/grant.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def loan_fixture_data():
     """Load the loan fixture data."""
-    return load_json_fixture("awards/loan.json")
+    return _load_shared_json_fixture("awards/loan.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def top_recipients_response():
     """Load the top recipients response fixture."""
-    return load_json_fixture("top_recipients_response.json")
+    return _load_shared_json_fixture("top_recipients_response.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def search_results_contracts_data():
     """Load the search results fixture data for contracts."""
-    return load_json_fixture("awards/search_results_contracts.json")["results"]
+    return _load_shared_json_fixture("awards/search_results_contracts.json")["results"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def search_results_grants_data():
     """Load the search results fixture data for grants."""
-    return load_json_fixture("awards/search_results_grants.json")["results"]
+    return _load_shared_json_fixture("awards/search_results_grants.json")["results"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def search_results_idvs_data():
     """Load the search results fixture data for IDVs."""
-    return load_json_fixture("awards/search_results_idvs.json")["results"]
+    return _load_shared_json_fixture("awards/search_results_idvs.json")["results"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agency_fixture_data():
     """Load the agency fixture data."""
-    return load_json_fixture("agency.json")
+    return _load_shared_json_fixture("agency.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agency_award_summary_fixture_data():
     """Load the agency award summary fixture data."""
-    return load_json_fixture("agency_award_summary.json")
+    return _load_shared_json_fixture("agency_award_summary.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agency_subagencies_fixture_data():
     """Load the agency sub-agencies fixture data."""
-    return load_json_fixture("agency_subagencies.json")
+    return _load_shared_json_fixture("agency_subagencies.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agency_autocomplete_fixture():
     """Load agency autocomplete fixture data."""
-    return load_json_fixture("agency_autocomplete.json")
+    return _load_shared_json_fixture("agency_autocomplete.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def recipients_search_fixture_data():
     """Load the recipients search fixture data."""
-    return load_json_fixture("recipients_search.json")
+    return _load_shared_json_fixture("recipients_search.json")
@@ -15,6 +15,8 @@ from usaspending.exceptions import APIError, HTTPError
 
 from .response_builder import ResponseBuilder
 
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
 
 class MockUSASpendingClient(USASpendingClient):
     class Endpoints:
@@ -95,7 +97,7 @@ class MockUSASpendingClient(USASpendingClient):
         self._rate_limit_delay = 0.0
 
         # Fixture directory
-        self._fixture_dir = Path(__file__).parent.parent / "fixtures"
+        self._fixture_dir = FIXTURES_DIR
 
     def _make_request(
         self,
@@ -288,9 +290,7 @@ class MockUSASpendingClient(USASpendingClient):
             transform: Optional function to transform fixture data
         """
         fixture_path = self._fixture_dir / f"{fixture_name}.json"
-
-        with open(fixture_path) as f:
-            data = json.load(f)
+        data = json.loads(fixture_path.read_bytes())
 
         if transform:
             data = transform(data)
@@ -547,12 +547,8 @@ class MockUSASpendingClient(USASpendingClient):
         """
         if response_data is None:
             # Load default from fixture
-            import json
-            from copy import deepcopy
-
             fixture_path = self._fixture_dir / "download_assistance.json"
-            with open(fixture_path) as f:
-                response_data = deepcopy(json.load(f))
+            response_data = json.loads(fixture_path.read_bytes())
 
             # Customize for the specific request
             import datetime
@@ -594,12 +590,8 @@ class MockUSASpendingClient(USASpendingClient):
             response_data = custom_data
         else:
             # Load and customize fixture template
-            import json
-            from copy import deepcopy
-
             fixture_path = self._fixture_dir / "download_status.json"
-            with open(fixture_path) as f:
-                response_data = deepcopy(json.load(f))
+            response_data = json.loads(fixture_path.read_bytes())
 
             response_data["file_name"] = file_name
             response_data["status"] = status
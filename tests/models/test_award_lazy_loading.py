@@ -17,6 +17,12 @@ from tests.utils import assert_decimal_equal
 from usaspending.models import Award, Location, PeriodOfPerformance, Recipient
 
 
+def stub_fetch_details(record, return_value=None):
+    """Replace a record's _fetch_details with a Mock so fetches can be asserted."""
+    record._fetch_details = Mock(return_value=return_value)
+    return record._fetch_details
+
+
 class BaseTestAwardLazyLoading:
     """
     A mixin class for testing lazy loading from search results.
@@ -43,10 +49,23 @@ class BaseTestAwardLazyLoading:
 
     @pytest.fixture
     def award_from_search(self, mock_usa_client, search_results_data):
-        """Creates an Award object from the first search result."""
+        """Creates an Award object from the first search result.
+
+        The award's _fetch_details is stubbed and checked on teardown, so every
+        test using this fixture fails if it triggers an Award-level fetch. Tests
+        that expect a fetch install their own stub with stub_fetch_details().
+        """
+        award = self.AWARD_MODEL(search_results_data[0], mock_usa_client)
+        no_fetch = stub_fetch_details(award)
+        yield award
+        no_fetch.assert_not_called()
+
+    @pytest.fixture
+    def prefetched_award(self, mock_usa_client, search_results_data, detail_fixture_data):
+        """Creates an Award from a search result whose details have already been fetched."""
         award = self.AWARD_MODEL(search_results_data[0], mock_usa_client)
-        # Mock _fetch_details to ensure it's not called unless we want it to be
-        award._fetch_details = Mock(return_value=None)
+        stub_fetch_details(award, detail_fixture_data)
+        award.fetch_all_details()
         return award
 
     def test_basic_properties_no_fetch(self, award_from_search, search_results_data):
@@ -61,7 +80,26 @@ class BaseTestAwardLazyLoading:
         assert award.recipient_uei == search_result["Recipient UEI"]
         assert_decimal_equal(award.total_outlay, search_result["Total Outlays"])
 
-        award._fetch_details.assert_not_called()
+    def test_all_search_results_no_fetch_on_basic_properties(
+        self, monkeypatch, mock_usa_client, search_results_data
+    ):
+        """Test that every search result serves basic properties without a fetch."""
+        # One class-level stub covers every award built from the fixture rows
+        fetch = Mock(return_value=None)
+        monkeypatch.setattr(self.AWARD_MODEL, "_fetch_details", fetch)
+
+        for result in search_results_data:
+            award = self.AWARD_MODEL(result, mock_usa_client)
+
+            _ = award.award_identifier
+            _ = award.description
+            _ = award.award_amount
+            _ = award.recipient_uei
+            _ = award.covid19_obligations
+
+            assert not award._details_fetched, result["Award ID"]
+
+        fetch.assert_not_called()
 
     def test_complex_properties_no_fetch(self, award_from_search):
         """Test that complex object properties are built from search results without fetching."""
@@ -82,7 +120,10 @@ class BaseTestAwardLazyLoading:
         period = award.period_of_performance
         assert isinstance(period, PeriodOfPerformance)
 
-        award._fetch_details.assert_not_called()
+        # Sub-objects are built once and cached on the award
+        assert award.recipient is recipient
+        assert award.place_of_performance is pop
+        assert award.period_of_performance is period
 
     def test_recipient_stub_no_recipient_level_fetch(self, award_from_search, search_results_data):
         """Test that accessing pre-loaded fields on the Recipient stub does not trigger
@@ -100,7 +141,7 @@ class BaseTestAwardLazyLoading:
         assert recipient is not None
 
         # Mock _fetch_details on the Recipient stub AFTER construction
-        recipient._fetch_details = Mock(return_value=None)
+        stub_fetch_details(recipient)
 
         # Access pre-loaded fields -- none should trigger a recipient-level fetch
         assert recipient.name is not None
@@ -115,9 +156,6 @@ class BaseTestAwardLazyLoading:
         # Verify no Recipient-level fetch was triggered
         recipient._fetch_details.assert_not_called()
 
-        # Also verify no Award-level fetch was triggered
-        award._fetch_details.assert_not_called()
-
     def test_recipient_stub_null_fields_no_fetch(self, award_from_search, search_results_data):
         """Test that accessing pre-loaded fields with None values on the Recipient stub
         does not trigger a Recipient-level fetch.
@@ -134,7 +172,7 @@ class BaseTestAwardLazyLoading:
         assert recipient is not None
 
         # Mock _fetch_details on the Recipient stub
-        recipient._fetch_details = Mock(return_value=None)
+        stub_fetch_details(recipient)
 
         # DUNS is null in the search result fixture and mapped to recipient_unique_id
         assert search_result.get("Recipient DUNS Number") is None
@@ -148,7 +186,7 @@ class BaseTestAwardLazyLoading:
         """Test that accessing a property not in search results triggers a fetch."""
         award = award_from_search
         # Replace the mock to return the detailed fixture data
-        award._fetch_details = Mock(return_value=detail_fixture_data)
+        stub_fetch_details(award, detail_fixture_data)
 
         # This property is not in the search results, so it should trigger a fetch
         assert award.subaward_count == detail_fixture_data["subaward_count"]
@@ -161,6 +199,11 @@ class BaseTestAwardLazyLoading:
         )
         award._fetch_details.assert_called_once()
 
+    @pytest.mark.parametrize("attr", ["category", "type", "subaward_count"])
+    def test_lazy_properties_after_fetch(self, prefetched_award, detail_fixture_data, attr):
+        """Test that detail-only properties are served from the completed fetch."""
+        assert getattr(prefetched_award, attr) == detail_fixture_data[attr]
+
 
 class TestContractLazyLoading(BaseTestAwardLazyLoading):
     """Tests lazy loading for Contract awards."""
@@ -190,7 +233,7 @@ class TestFetchAllDetails:
     def award_with_mock_fetch(self, mock_usa_client, search_results_contracts_data):
         """Create an Award with a mocked _fetch_details method."""
         award = Award(search_results_contracts_data[0], mock_usa_client)
-        award._fetch_details = Mock(return_value={"extra": "data"})
+        stub_fetch_details(award, {"extra": "data"})
         return award
 
     def test_fetch_all_details_calls_ensure_details(self, award_with_mock_fetch):
@@ -214,7 +257,7 @@ class TestFetchAllDetails:
     def test_fetch_all_details_updates_data(self, mock_usa_client, search_results_contracts_data):
         """Test that fetch_all_details() updates model data."""
         award = Award(search_results_contracts_data[0], mock_usa_client)
-        award._fetch_details = Mock(return_value={"new_field": "new_value"})
+        stub_fetch_details(award, {"new_field": "new_value"})
 
         initial_keys = set(award._data.keys())
         award.fetch_all_details()
@@ -1,19 +1,15 @@
 """Tests for Location model."""
 
-import json
-from pathlib import Path
-
 import pytest
 
+from tests.conftest import load_json_fixture
 from usaspending.models.location import Location
 
 
 @pytest.fixture
 def grant_data():
     """Load grant fixture data."""
-    fixture_path = Path(__file__).parent.parent / "fixtures" / "awards" / "grant.json"
-    with open(fixture_path) as f:
-        return json.load(f)
+    return load_json_fixture("awards/grant.json")
 
 
 @pytest.fixture
@@ -46,27 +46,21 @@ class TestPeriodOfPerformance:
         period = PeriodOfPerformance(sample_period_data)
         start_date = period.start_date
         assert isinstance(start_date, date)
-        assert start_date.year == 2018
-        assert start_date.month == 3
-        assert start_date.day == 5
+        assert start_date == date(2018, 3, 5)
 
     def test_end_date_property(self, sample_period_data):
         """Test end_date property returns correct date"""
         period = PeriodOfPerformance(sample_period_data)
         end_date = period.end_date
         assert isinstance(end_date, date)
-        assert end_date.year == 2025
-        assert end_date.month == 8
-        assert end_date.day == 23
+        assert end_date == date(2025, 8, 23)
 
     def test_last_modified_date_property(self, sample_period_data):
         """Test last_modified_date property returns correct date"""
         period = PeriodOfPerformance(sample_period_data)
         last_modified = period.last_modified_date
         assert isinstance(last_modified, date)
-        assert last_modified.year == 2025
-        assert last_modified.month == 6
-        assert last_modified.day == 23
+        assert last_modified == date(2025, 6, 23)
 
     def test_alternate_key_names(self, period_with_alternate_keys):
         """Test that alternate key names are properly handled"""
@@ -75,23 +69,17 @@ class TestPeriodOfPerformance:
         # Should pick up "Start Date"
         start_date = period.start_date
         assert isinstance(start_date, date)
-        assert start_date.year == 2020
-        assert start_date.month == 1
-        assert start_date.day == 1
+        assert start_date == date(2020, 1, 1)
 
         # Should pick up "End Date"
         end_date = period.end_date
         assert isinstance(end_date, date)
-        assert end_date.year == 2021
-        assert end_date.month == 12
-        assert end_date.day == 31
+        assert end_date == date(2021, 12, 31)
 
         # Should pick up "Last Modified Date"
         last_modified = period.last_modified_date
         assert isinstance(last_modified, date)
-        assert last_modified.year == 2021
-        assert last_modified.month == 6
-        assert last_modified.day == 15
+        assert last_modified == date(2021, 6, 15)
 
     def test_period_of_performance_keys_priority(self):
         """Test that Period of Performance keys have lower priority"""
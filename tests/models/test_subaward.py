@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from datetime import date
-from pathlib import Path
 
 import pytest
 
+from tests.conftest import load_json_fixture
 from usaspending.models.award import Award
 from usaspending.models.location import Location
 from usaspending.models.recipient import Recipient
@@ -20,12 +19,8 @@ class TestSubAwardModel:
     @pytest.fixture
     def subaward_data(self):
         """Load subaward fixture data."""
-        fixture_path = (
-            Path(__file__).parent.parent / "fixtures" / "awards" / "search_results_subawards.json"
-        )
-        with open(fixture_path) as f:
-            data = json.load(f)
-        return data["results"][0]  # First subaward from the fixture
+        # First subaward from the fixture
+        return load_json_fixture("awards/search_results_subawards.json")["results"][0]
 
     def test_subaward_initialization(self, subaward_data, mock_usa_client):
         """Test SubAward can be initialized with data."""
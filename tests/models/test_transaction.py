@@ -1,9 +1,8 @@
-import json
 from datetime import date
-from pathlib import Path
 
 import pytest
 
+from tests.conftest import load_json_fixture
 from tests.mocks.response_builder import ResponseBuilder
 from usaspending.models.transaction import Transaction
 
@@ -11,10 +10,7 @@ from usaspending.models.transaction import Transaction
 class TestTransaction:
     @pytest.fixture
     def transaction_data(self):
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "awards" / "transactions.json"
-        with open(fixture_path) as f:
-            data = json.load(f)
-        return data["results"][0]
+        return load_json_fixture("awards/transactions.json")["results"][0]
 
     @pytest.fixture
     def transaction(self, transaction_data):
@@ -22,22 +18,28 @@ class TestTransaction:
 
     @pytest.fixture
     def all_transaction_data(self):
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "awards" / "transactions.json"
-        with open(fixture_path) as f:
-            data = json.load(f)
-        return data["results"]
-
-    def test_id(self, transaction):
-        assert transaction.id == "CONT_TX_8000_-NONE-_80GSFC18C0008_P00065_-NONE-_0"
-
-    def test_type(self, transaction):
-        assert transaction.type == "D"
-
-    def test_type_description(self, transaction):
-        assert transaction.type_description == "DEFINITIVE CONTRACT"
-
-    def test_action_date_parsing(self, transaction):
-        assert transaction.action_date == date(2025, 6, 23)
+        return load_json_fixture("awards/transactions.json")["results"]
+
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("id", "CONT_TX_8000_-NONE-_80GSFC18C0008_P00065_-NONE-_0"),
+            ("type", "D"),
+            ("type_description", "DEFINITIVE CONTRACT"),
+            ("action_date", date(2025, 6, 23)),
+            ("action_type", "C"),
+            ("action_type_description", "FUNDING ONLY ACTION"),
+            ("modification_number", "P00065"),
+            ("award_description", "The tandem reconnection...."),
+            ("federal_action_obligation", 1600000.0),
+            ("face_value_loan_guarantee", 0.0),
+            ("original_loan_subsidy_cost", 0.0),
+            ("cfda_number", None),
+            ("amt", 1600000.0),
+        ],
+    )
+    def test_fixture_properties(self, transaction, attr, expected):
+        assert getattr(transaction, attr) == expected
 
     def test_action_date_invalid_format(self):
         invalid_data = {"action_date": "invalid-date"}
@@ -49,33 +51,6 @@ class TestTransaction:
         transaction = Transaction(no_date_data)
         assert transaction.action_date is None
 
-    def test_action_type(self, transaction):
-        assert transaction.action_type == "C"
-
-    def test_action_type_description(self, transaction):
-        assert transaction.action_type_description == "FUNDING ONLY ACTION"
-
-    def test_modification_number(self, transaction):
-        assert transaction.modification_number == "P00065"
-
-    def test_award_description_sentence_case(self, transaction):
-        assert transaction.award_description == "The tandem reconnection...."
-
-    def test_federal_action_obligation(self, transaction):
-        assert transaction.federal_action_obligation == 1600000.0
-
-    def test_face_value_loan_guarantee(self, transaction):
-        assert transaction.face_value_loan_guarantee == 0.0
-
-    def test_original_loan_subsidy_cost(self, transaction):
-        assert transaction.original_loan_subsidy_cost == 0.0
-
-    def test_cfda_number_missing(self, transaction):
-        assert transaction.cfda_number is None
-
-    def test_amt_federal_action_obligation(self, transaction):
-        assert transaction.amt == 1600000.0
-
     def test_amt_face_value_loan_guarantee(self):
         data = {
             "federal_action_obligation": None,
@@ -16,6 +16,7 @@ import pytest
 
 from usaspending.exceptions import ValidationError
 from usaspending.queries.awards_search import AwardsSearch
+from usaspending.queries.subawards_search import SubAwardsSearch
 
 
 @pytest.fixture
@@ -554,8 +555,6 @@ class TestSubAwardTimePeriodRestrictions:
     @pytest.fixture
     def subaward_builder(self, mock_usa_client):
         """Create a SubAwardsSearch instance."""
-        from usaspending.queries.subawards_search import SubAwardsSearch
-
         return SubAwardsSearch(mock_usa_client)
 
     def test_subaward_accepts_action_date(self, subaward_builder):
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
 import pytest
+from tests.conftest import load_json_fixture
 from tests.mocks.mock_client import MockUSASpendingClient
 
 from usaspending.exceptions import ValidationError
@@ -19,11 +17,7 @@ class TestSubAwardsSearch:
     @pytest.fixture
     def subawards_response(self):
         """Load subawards fixture data."""
-        fixture_path = (
-            Path(__file__).parent.parent / "fixtures" / "awards" / "search_results_subawards.json"
-        )
-        with open(fixture_path) as f:
-            return json.load(f)
+        return load_json_fixture("awards/search_results_subawards.json")
 
     def test_subawards_search_initialization(self, mock_usa_client):
         """Test SubAwardsSearch can be initialized."""